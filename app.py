@@ -1,7 +1,8 @@
 import sqlite3
-import json
+import threading
 from datetime import date
 
+import pandas as pd
 import streamlit as st
 
 DB_PATH = "networth.db"
@@ -19,7 +20,7 @@ DB_PATH = "networth.db"
 # - currency
 # - amount (value / outstanding)
 # - owner
-# - details_json (for extra fields)
+# Extra fields live in the entry_details table as one (entry_id, key, value) row per field.
 
 ASSET_SCHEMAS = {
     "Cash & Cash-like": {
@@ -367,108 +368,407 @@ LIABILITY_SCHEMAS = {
 # Flatten category lists for UI
 ASSET_CATEGORIES = list(ASSET_SCHEMAS.keys())
 LIABILITY_CATEGORIES = list(LIABILITY_SCHEMAS.keys())
+ASSET_SUBCATS = {cat: tuple(subcats) for cat, subcats in ASSET_SCHEMAS.items()}
+LIABILITY_SUBCATS = {cat: tuple(subcats) for cat, subcats in LIABILITY_SCHEMAS.items()}
+
+
+def _parse_type(type_str):
+    """'select:A,B' -> ('select', ('A', 'B')); anything else -> (type_str, None)."""
+    if type_str.startswith("select:"):
+        return "select", tuple(type_str.split(":", 1)[1].split(","))
+    return type_str, None
+
+
+def _compile_schemas(kind, schemas):
+    """Widget keys are short "kind:cat_idx:sub_idx:field_idx" strings, built here once rather than per rerun."""
+    return {
+        category: {
+            subcategory: tuple(
+                (field_name, label) + _parse_type(type_str) + (f"{kind}:{cat_idx}:{sub_idx}:{field_idx}",)
+                for field_idx, (field_name, label, type_str) in enumerate(fields)
+            )
+            for sub_idx, (subcategory, fields) in enumerate(subcats.items())
+        }
+        for cat_idx, (category, subcats) in enumerate(schemas.items())
+    }
+
+
+# Parsed once at import: cat -> subcat -> ((field_name, label, type_kind, type_arg, key), ...)
+ASSET_SCHEMAS_COMPILED = _compile_schemas("asset", ASSET_SCHEMAS)
+LIABILITY_SCHEMAS_COMPILED = _compile_schemas("liability", LIABILITY_SCHEMAS)
 
 
 # -----------------------------
 # 2. DATABASE HELPERS
 # -----------------------------
 
+@st.cache_resource
+def get_conn():
+    """Single SQLite connection shared across reruns (Streamlit re-executes the script per interaction)."""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-8000")  # ~8 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    return conn
+
+
+@st.cache_resource
+def db_lock():
+    """
+    Guards the shared connection, which every session's thread uses; sqlite3 leaves that to the caller.
+    Held by writes, and by the reads that fill st.cache_data, so a cached result never includes another
+    session's uncommitted INSERT (which a rollback would leave cached without a version bump).
+    Cached rather than module-level because Streamlit re-executes this module on every rerun.
+    """
+    return threading.Lock()
+
+
+@st.cache_resource
+def db_state():
+    """Process-wide write counter; cached reads are keyed on it so any insert invalidates them."""
+    return {"version": 0}
+
+
+@st.cache_resource
 def init_db():
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute(
-        """
-        CREATE TABLE IF NOT EXISTS entries (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            kind TEXT NOT NULL,              -- 'asset' or 'liability'
-            category TEXT NOT NULL,
-            subcategory TEXT NOT NULL,
-            name TEXT NOT NULL,
-            currency TEXT,
-            amount REAL NOT NULL,
-            owner TEXT,
-            details_json TEXT,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+    """Runs once per process; later reruns hit the cache instead of re-issuing the DDL."""
+    conn = get_conn()
+    with db_lock(), conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,              -- 'asset' or 'liability'
+                category TEXT NOT NULL,
+                subcategory TEXT NOT NULL,
+                name TEXT NOT NULL,
+                currency TEXT,
+                amount REAL NOT NULL,
+                owner TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+            """
         )
-        """
-    )
-    conn.commit()
-    conn.close()
+        # Covers the grouped SUM in get_totals without touching the table.
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_entries_kind ON entries(kind, amount)")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_entries_kcs ON entries(kind, category, subcategory, created_at DESC)"
+        )
+        # Lets the dashboard's unfiltered "ORDER BY created_at DESC LIMIT ?" walk the index and stop early.
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_entries_created ON entries(created_at DESC)")
+        # Per-field details are kept out of `entries` so the rows scanned for totals and listings stay narrow.
+        # `value` holds each field as JSON text, so nested objects, arrays and booleans round-trip intact.
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entry_details (
+                entry_id INTEGER NOT NULL REFERENCES entries(id),
+                key TEXT NOT NULL,
+                value
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_entry_details_entry ON entry_details(entry_id)")
+
+        # Migrate databases created before entry_details existed.
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(entries)")}
+        if "details_json" in columns:
+            pending = conn.execute("SELECT EXISTS(SELECT 1 FROM entries WHERE details_json IS NOT NULL)").fetchone()[0]
+            if pending:
+                conn.execute(
+                    """
+                    INSERT INTO entry_details (entry_id, key, value)
+                    SELECT
+                        e.id,
+                        j.key,
+                        CASE
+                            WHEN j.type IN ('object', 'array') THEN json(j.value)
+                            WHEN j.type IN ('true', 'false', 'null') THEN j.type
+                            ELSE json_quote(j.value)
+                        END
+                    FROM entries e, json_each(e.details_json) j
+                    -- Only JSON objects: json_each on a scalar/array yields NULL or index keys.
+                    -- json_type() raises on malformed text, hence the json_valid() guard.
+                    WHERE CASE WHEN json_valid(e.details_json) THEN json_type(e.details_json) = 'object' END
+                    ORDER BY e.id, j.id
+                    """
+                )
+            if sqlite3.sqlite_version_info >= (3, 35, 0):
+                conn.execute("ALTER TABLE entries DROP COLUMN details_json")
+            elif pending:
+                # No DROP COLUMN before SQLite 3.35: leave the column, emptied so the backfill isn't repeated.
+                conn.execute("UPDATE entries SET details_json = NULL WHERE details_json IS NOT NULL")
+
+
+def insert_entries(rows):
+    """
+    rows: iterable of (kind, category, subcategory, name, currency, amount, owner, details)
+    All rows, and their details, are written in a single transaction.
+    """
+    conn = get_conn()
+    with db_lock():
+        with conn:
+            # Row by row rather than executemany: each entry's id is needed for its detail rows.
+            detail_rows = []
+            for kind, category, subcategory, name, currency, amount, owner, details in rows:
+                cur = conn.execute(
+                    """
+                    INSERT INTO entries (kind, category, subcategory, name, currency, amount, owner)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (kind, category, subcategory, name, currency, amount, owner),
+                )
+                # lastrowid is per connection; db_lock() keeps other sessions from inserting in between.
+                # (INSERT ... RETURNING would need SQLite 3.35+.)
+                detail_rows.extend((cur.lastrowid, key, value) for key, value in details.items())
+            conn.executemany(
+                "INSERT INTO entry_details (entry_id, key, value) VALUES (?, ?, json_quote(?))", detail_rows
+            )
+        db_state()["version"] += 1
 
 
 def insert_entry(kind, category, subcategory, name, currency, amount, owner, details):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute(
+    insert_entries([(kind, category, subcategory, name, currency, amount, owner, details)])
+
+
+def get_totals():
+    conn = get_conn()
+    totals = dict(conn.execute("SELECT kind, COALESCE(SUM(amount),0) FROM entries GROUP BY kind"))
+    return totals.get("asset", 0.0), totals.get("liability", 0.0)
+
+
+# Fixed query texts, so sqlite3's statement cache reuses the prepared plans.
+Q_RECENT_ENTRIES = """
+    SELECT id, kind, category, subcategory, name, currency, amount, owner, created_at FROM entries
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+
+def list_entries_meta(limit=None):
+    """Most recent entries across all kinds, without their details; fetch those per entry with load_details."""
+    conn = get_conn()
+    return conn.execute(Q_RECENT_ENTRIES, (limit or -1,)).fetchall()
+
+
+Q_CATEGORY_ENTRIES = """
+    SELECT id, name, currency, amount, owner, created_at FROM entries
+    WHERE kind=? AND category=? AND subcategory=?
+    ORDER BY created_at DESC
+"""
+
+
+def list_category_entries(kind, category, subcategory):
+    """Only the columns the Assets/Liabilities listings display; kind/category/subcategory are already known."""
+    conn = get_conn()
+    return conn.execute(Q_CATEGORY_ENTRIES, (kind, category, subcategory)).fetchall()
+
+
+def load_details(entry_id):
+    """Details of one entry as JSON object text, or None if it has none."""
+    conn = get_conn()
+    row = conn.execute(
         """
-        INSERT INTO entries (kind, category, subcategory, name, currency, amount, owner, details_json)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        SELECT json_group_object(key, json(value)) AS details
+        FROM (SELECT key, value FROM entry_details WHERE entry_id=? ORDER BY rowid)
+        HAVING COUNT(*) > 0
         """,
-        (kind, category, subcategory, name, currency, amount, owner, json.dumps(details)),
-    )
-    conn.commit()
-    conn.close()
+        (entry_id,),
+    ).fetchone()
+    return row["details"] if row else None
 
 
-def get_totals():
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    c.execute("SELECT COALESCE(SUM(amount),0) FROM entries WHERE kind='asset'")
-    total_assets = c.fetchone()[0] or 0.0
-    c.execute("SELECT COALESCE(SUM(amount),0) FROM entries WHERE kind='liability'")
-    total_liabilities = c.fetchone()[0] or 0.0
-    conn.close()
-    return total_assets, total_liabilities
-
-
-def get_entries(kind=None, category=None):
-    conn = sqlite3.connect(DB_PATH)
-    c = conn.cursor()
-    query = "SELECT id, kind, category, subcategory, name, currency, amount, owner, details_json, created_at FROM entries WHERE 1=1"
-    params = []
-    if kind:
-        query += " AND kind=?"
-        params.append(kind)
-    if category:
-        query += " AND category=?"
-        params.append(category)
-    query += " ORDER BY created_at DESC"
-    c.execute(query, params)
-    rows = c.fetchall()
-    conn.close()
-    return rows
+# Every write bumps the version and strands older cache entries; cap them so they don't pile up.
+# Totals/recent only need the current version (plus slack for concurrent sessions); the category
+# listing needs one entry per subcategory.
+RECENT_CACHE_ENTRIES = 4
+SUBCATEGORY_COUNT = sum(map(len, ASSET_SUBCATS.values())) + sum(map(len, LIABILITY_SUBCATS.values()))
+
+
+@st.cache_data(max_entries=RECENT_CACHE_ENTRIES)
+def cached_totals(version):
+    with db_lock():
+        return get_totals()
+
+
+@st.cache_data(max_entries=RECENT_CACHE_ENTRIES)
+def cached_recent(version, limit):
+    # sqlite3.Row can't be pickled into st.cache_data; plain dicts keep access by column name.
+    with db_lock():
+        return [dict(r) for r in list_entries_meta(limit=limit)]
+
+
+@st.cache_data(max_entries=2 * SUBCATEGORY_COUNT)
+def cached_category_entries(version, kind, category, subcategory):
+    with db_lock():
+        return [dict(r) for r in list_category_entries(kind, category, subcategory)]
 
 
 # -----------------------------
 # 3. FORM RENDERING
 # -----------------------------
 
+def _date_field(label, key):
+    d = st.date_input(label, key=key, value=date.today())
+    return d.isoformat() if isinstance(d, date) else str(d)
+
+
+FIELD_RENDERERS = {
+    "select": lambda label, key, options: st.selectbox(label, options, key=key),
+    "text": lambda label, key, _: st.text_input(label, key=key),
+    "number": lambda label, key, _: st.number_input(label, key=key, step=1.0, format="%.4f"),
+    "date": lambda label, key, _: _date_field(label, key),
+}
+
+
 def render_detail_fields(schema):
     """
-    schema: list of (field_name, label, type_str)
+    schema: compiled tuple of (field_name, label, type_kind, type_arg, key)
     Returns dict of values for each field_name.
     """
     values = {}
-    for field_name, label, type_str in schema:
-        if type_str.startswith("select:"):
-            options = type_str.split(":", 1)[1].split(",")
-            values[field_name] = st.selectbox(label, options, key=f"{field_name}_{label}")
-        elif type_str == "text":
-            values[field_name] = st.text_input(label, key=f"{field_name}_{label}")
-        elif type_str == "number":
-            values[field_name] = st.number_input(label, key=f"{field_name}_{label}", step=1.0, format="%.4f")
-        elif type_str == "date":
-            d = st.date_input(label, key=f"{field_name}_{label}", value=date.today())
-            values[field_name] = d.isoformat() if isinstance(d, date) else str(d)
-        else:
-            values[field_name] = st.text_input(label, key=f"{field_name}_{label}")
+    for field_name, label, type_kind, type_arg, key in schema:
+        render = FIELD_RENDERERS.get(type_kind, FIELD_RENDERERS["text"])
+        values[field_name] = render(label, key, type_arg)
     return values
 
 
+COLUMN_CONFIG = {
+    "id": "ID",
+    "kind": "Kind",
+    "category": "Category",
+    "subcategory": "Subcategory",
+    "name": "Name",
+    "currency": "Currency",
+    "amount": st.column_config.NumberColumn("Amount", format="%.2f"),
+    "owner": "Owner",
+    "created_at": "Created at",
+}
+
+
+def render_entries_table(rows, key):
+    """
+    rows: non-empty list of sqlite3.Row (or dicts) with at least "id" and "name".
+    Renders all rows as one dataframe; details are fetched only once a row is selected.
+    """
+    columns = list(rows[0].keys())
+    df = pd.DataFrame(rows, columns=columns)
+    st.dataframe(df, hide_index=True, column_config={c: COLUMN_CONFIG.get(c, c) for c in columns})
+
+    names = {r["id"]: r["name"] for r in rows}
+    entry_id = st.selectbox(
+        "Inspect row",
+        list(names),
+        index=None,
+        placeholder="Choose an entry to see its details",
+        format_func=lambda i: f"#{i} – {names[i]}",
+        key=key,
+    )
+    if entry_id is None:
+        return
+    details = load_details(entry_id)
+    if details:
+        st.write("Details:")
+        st.json(details)
+    else:
+        st.write("No additional details.")
+
+
 # -----------------------------
 # 4. STREAMLIT UI
 # -----------------------------
 
+# Per-kind wording and schemas; the Assets and Liabilities views share render_kind_view.
+KIND_VIEWS = {
+    "asset": {
+        "header": "Assets",
+        "title": "Asset",
+        "categories": ASSET_CATEGORIES,
+        "subcats": ASSET_SUBCATS,
+        "schemas": ASSET_SCHEMAS_COMPILED,
+        "form_key": "asset_form",
+        "name_label": "Asset name / label (e.g. 'DBS SGD savings', 'Apple Inc. shares')",
+        "owner_label": "Owner (You / Spouse / Joint / Trust / Co)",
+        "amount_label": "Current value / balance",
+        "name_error": "Please provide an Asset name / label.",
+        "amount_error": "Amount must be greater than 0.",
+        "list_header": "### Existing assets in this category",
+        "empty": "No assets recorded yet for this category.",
+    },
+    "liability": {
+        "header": "Liabilities",
+        "title": "Liability",
+        "categories": LIABILITY_CATEGORIES,
+        "subcats": LIABILITY_SUBCATS,
+        "schemas": LIABILITY_SCHEMAS_COMPILED,
+        "form_key": "liab_form",
+        "name_label": "Liability name / label (e.g. 'Home loan – OCBC', 'Credit card – HSBC')",
+        "owner_label": "Borrower / owner (You / Spouse / Joint / Co / Trust)",
+        "amount_label": "Outstanding amount",
+        "name_error": "Please provide a Liability name / label.",
+        "amount_error": "Outstanding amount must be greater than 0.",
+        "list_header": "### Existing liabilities in this category",
+        "empty": "No liabilities recorded yet for this category.",
+    },
+}
+
+
+@st.fragment
+def add_entry_form(kind, category, subcategory):
+    """
+    Runs as a fragment. Typing inside st.form never reruns anything; the fragment only matters on submit:
+    a failed validation re-executes just this form, not the listing below it. A successful save costs a
+    fragment run plus a full st.rerun() (so the listing picks up the new entry), one more run than before.
+    """
+    cfg = KIND_VIEWS[kind]
+    saved_key = f"{kind}_saved"
+
+    st.subheader(f"Add {cfg['title']} – {category} / {subcategory}")
+    with st.form(cfg["form_key"]):
+        name = st.text_input(cfg["name_label"])
+
+        col1, col2, col3 = st.columns(3)
+        currency = col1.text_input("Currency (e.g. SGD, USD, EUR)", value="SGD")
+        owner = col2.text_input(cfg["owner_label"], value="You")
+        amount = col3.number_input(cfg["amount_label"], min_value=0.0, step=1.0, format="%.2f")
+
+        st.markdown("**Additional details** (for this subcategory)")
+        schema = cfg["schemas"][category][subcategory]
+        details = render_detail_fields(schema)
+
+        submitted = st.form_submit_button(f"Save {cfg['title'].lower()}")
+        if submitted:
+            if not name:
+                st.error(cfg["name_error"])
+            elif amount <= 0:
+                st.error(cfg["amount_error"])
+            else:
+                insert_entry(kind, category, subcategory, name, currency, amount, owner, details)
+                st.session_state[saved_key] = True
+                st.rerun()
+        elif st.session_state.pop(saved_key, False):
+            st.success(f"{cfg['title']} saved successfully.")
+
+
+def render_kind_view(kind):
+    """Add-entry form plus listing for one kind ('asset' or 'liability')."""
+    cfg = KIND_VIEWS[kind]
+    st.header(cfg["header"])
+    category = st.selectbox("Category", cfg["categories"])
+    subcategory = st.selectbox("Subcategory", cfg["subcats"][category])
+
+    add_entry_form(kind, category, subcategory)
+
+    st.markdown(cfg["list_header"])
+    rows = cached_category_entries(db_state()["version"], kind, category, subcategory)
+    if rows:
+        render_entries_table(rows, key=f"inspect_{kind}")
+    else:
+        st.info(cfg["empty"])
+
+
 def main():
     st.set_page_config(page_title="Net Worth Tracker", layout="wide")
     st.title("Net Worth Tracker (Python + SQLite)")
@@ -479,7 +779,8 @@ def main():
 
     # DASHBOARD
     if view == "Dashboard":
-        total_assets, total_liabilities = get_totals()
+        version = db_state()["version"]
+        total_assets, total_liabilities = cached_totals(version)
         net_worth = total_assets - total_liabilities
 
         col1, col2, col3 = st.columns(3)
@@ -488,145 +789,15 @@ def main():
         col3.metric("Net Worth", f"{net_worth:,.2f}")
 
         st.markdown("### Recent Entries")
-        rows = get_entries()
+        rows = cached_recent(version, 20)
         if rows:
-            for r in rows[:20]:
-                id_, kind, category, subcat, name, cur, amt, owner, details_json, created_at = r
-                with st.expander(f"[{kind.upper()}] {name} ({category} / {subcat}) - {amt:,.2f} {cur or ''}"):
-                    st.write(f"Owner: {owner or '-'}")
-                    st.write(f"Created at: {created_at}")
-                    if details_json:
-                        try:
-                            details = json.loads(details_json)
-                        except Exception:
-                            details = {}
-                        if details:
-                            st.write("Details:")
-                            st.json(details)
+            render_entries_table(rows, key="inspect_recent")
         else:
             st.info("No entries yet. Go to Assets or Liabilities to start adding data.")
 
-    # ASSETS
-    elif view == "Assets":
-        st.header("Assets")
-        category = st.selectbox("Category", ASSET_CATEGORIES)
-        subcats = list(ASSET_SCHEMAS[category].keys())
-        subcategory = st.selectbox("Subcategory", subcats)
-
-        st.subheader(f"Add Asset – {category} / {subcategory}")
-        with st.form("asset_form"):
-            name = st.text_input("Asset name / label (e.g. 'DBS SGD savings', 'Apple Inc. shares')")
-
-            col1, col2, col3 = st.columns(3)
-            currency = col1.text_input("Currency (e.g. SGD, USD, EUR)", value="SGD")
-            owner = col2.text_input("Owner (You / Spouse / Joint / Trust / Co)", value="You")
-            amount = col3.number_input("Current value / balance", min_value=0.0, step=1.0, format="%.2f")
-
-            st.markdown("**Additional details** (for this subcategory)")
-            schema = ASSET_SCHEMAS[category][subcategory]
-            details = render_detail_fields(schema)
-
-            submitted = st.form_submit_button("Save asset")
-            if submitted:
-                if not name:
-                    st.error("Please provide an Asset name / label.")
-                elif amount <= 0:
-                    st.error("Amount must be greater than 0.")
-                else:
-                    insert_entry(
-                        "asset",
-                        category,
-                        subcategory,
-                        name,
-                        currency,
-                        amount,
-                        owner,
-                        details,
-                    )
-                    st.success("Asset saved successfully.")
-
-        st.markdown("### Existing assets in this category")
-        rows = get_entries(kind="asset", category=category)
-        if rows:
-            for r in rows:
-                id_, kind, cat, subcat, name, cur, amt, owner, details_json, created_at = r
-                if subcat != subcategory:
-                    continue
-                with st.expander(f"{name} – {amt:,.2f} {cur or ''}"):
-                    st.write(f"Subcategory: {subcat}")
-                    st.write(f"Owner: {owner or '-'}")
-                    st.write(f"Created at: {created_at}")
-                    if details_json:
-                        try:
-                            details = json.loads(details_json)
-                        except Exception:
-                            details = {}
-                        if details:
-                            st.write("Details:")
-                            st.json(details)
-        else:
-            st.info("No assets recorded yet for this category.")
-
-    # LIABILITIES
-    elif view == "Liabilities":
-        st.header("Liabilities")
-        category = st.selectbox("Category", list(LIABILITY_SCHEMAS.keys()))
-        subcats = list(LIABILITY_SCHEMAS[category].keys())
-        subcategory = st.selectbox("Subcategory", subcats)
-
-        st.subheader(f"Add Liability – {category} / {subcategory}")
-        with st.form("liab_form"):
-            name = st.text_input("Liability name / label (e.g. 'Home loan – OCBC', 'Credit card – HSBC')")
-
-            col1, col2, col3 = st.columns(3)
-            currency = col1.text_input("Currency (e.g. SGD, USD, EUR)", value="SGD")
-            owner = col2.text_input("Borrower / owner (You / Spouse / Joint / Co / Trust)", value="You")
-            amount = col3.number_input("Outstanding amount", min_value=0.0, step=1.0, format="%.2f")
-
-            st.markdown("**Additional details** (for this subcategory)")
-            schema = LIABILITY_SCHEMAS[category][subcategory]
-            details = render_detail_fields(schema)
-
-            submitted = st.form_submit_button("Save liability")
-            if submitted:
-                if not name:
-                    st.error("Please provide a Liability name / label.")
-                elif amount <= 0:
-                    st.error("Outstanding amount must be greater than 0.")
-                else:
-                    insert_entry(
-                        "liability",
-                        category,
-                        subcategory,
-                        name,
-                        currency,
-                        amount,
-                        owner,
-                        details,
-                    )
-                    st.success("Liability saved successfully.")
-
-        st.markdown("### Existing liabilities in this category")
-        rows = get_entries(kind="liability", category=category)
-        if rows:
-            for r in rows:
-                id_, kind, cat, subcat, name, cur, amt, owner, details_json, created_at = r
-                if subcat != subcategory:
-                    continue
-                with st.expander(f"{name} – {amt:,.2f} {cur or ''}"):
-                    st.write(f"Subcategory: {subcat}")
-                    st.write(f"Owner: {owner or '-'}")
-                    st.write(f"Created at: {created_at}")
-                    if details_json:
-                        try:
-                            details = json.loads(details_json)
-                        except Exception:
-                            details = {}
-                        if details:
-                            st.write("Details:")
-                            st.json(details)
-        else:
-            st.info("No liabilities recorded yet for this category.")
+    # ASSETS / LIABILITIES
+    else:
+        render_kind_view("asset" if view == "Assets" else "liability")
 
 
 if __name__ == "__main__":